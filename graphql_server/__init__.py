@@ -9,6 +9,8 @@ for building GraphQL servers or integrations into existing web frameworks using
 import json
 from collections import namedtuple
 from collections.abc import MutableMapping
+from functools import lru_cache
+from operator import attrgetter
 from typing import Any, Callable, Collection, Dict, List, Optional, Type, Union, cast
 
 from graphql.error import GraphQLError
@@ -22,6 +24,13 @@ from graphql.validation import ASTValidationRule, validate
 from .error import HttpQueryError
 from .version import version, version_info
 
+# orjson parses UTF-8 encoded bytes directly and is much faster than the
+# standard library, but it is only an optional dependency
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore
+
 # The GraphQL-Server 3 version info.
 
 __version__ = version
@@ -178,13 +187,15 @@ def encode_execution_results(
 
 
 def load_json_body(data):
-    # type: (str) -> Union[Dict, List]
+    # type: (Union[str, bytes]) -> Union[Dict, List]
     """Load the request body as a dictionary or a list.
 
-    The body must be passed in a string and will be deserialized from JSON,
-    raising an HttpQueryError in case of invalid JSON.
+    The body must be passed as a string or as UTF-8 encoded bytes and will be
+    deserialized from JSON, raising an HttpQueryError in case of invalid JSON.
     """
     try:
+        if orjson is not None:
+            return orjson.loads(data)
         return json.loads(data)
     except Exception:
         raise HttpQueryError(400, "POST body sent invalid JSON.")
@@ -194,11 +205,41 @@ def load_json_body(data):
 
 FormattedResult = namedtuple("FormattedResult", "result status_code")
 
+# C-level shortcut for the default error formatting, which just reads
+# the formatted property of each error
+_get_formatted = attrgetter("formatted")
+
+
+def _encode_error_response(message: str) -> str:
+    """Encode an error response consisting of a single message.
+
+    This produces the same output as passing the formatted error through
+    json_encode, but skips building the intermediate dictionaries and the
+    generic JSON encoder dispatch. It can only be used when the default
+    error formatting and encoding functions are in place.
+    """
+    return '{"errors":[{"message":' + json.dumps(message) + "}]}"
+
 
 class _NoException(Exception):
     """Private exception used when we don't want to catch any real exception."""
 
 
+# Clients tend to send the same handful of queries over and over again,
+# so the parsed documents and their validation results are memoized.
+# Invalid queries raise and are therefore not cached.
+
+
+@lru_cache(maxsize=1024)
+def _parse_cached(query: str):
+    return parse(query)
+
+
+@lru_cache(maxsize=1024)
+def _validate_cached(schema, document, rules, max_errors):
+    return validate(schema, document, rules=rules, max_errors=max_errors)
+
+
 def get_graphql_params(data: Dict, query_data: Dict) -> GraphQLParams:
     """Fetch GraphQL query, variables and operation name parameters from given data.
 
@@ -235,6 +276,10 @@ def assume_not_awaitable(_value: Any) -> bool:
     return False
 
 
+# The only operation allowed on GET requests, resolved from the enum once
+_QUERY_OPERATION = OperationType.QUERY.value
+
+
 def get_response(
     schema: GraphQLSchema,
     params: GraphQLParams,
@@ -268,7 +313,7 @@ def get_response(
             return ExecutionResult(data=None, errors=schema_validation_errors)
 
         try:
-            document = parse(params.query)
+            document = _parse_cached(params.query)
         except GraphQLError as e:
             return ExecutionResult(data=None, errors=[e])
         except Exception as e:
@@ -279,7 +324,7 @@ def get_response(
             operation_ast = get_operation_ast(document, params.operation_name)
             if operation_ast:
                 operation = operation_ast.operation.value
-                if operation != OperationType.QUERY.value:
+                if operation != _QUERY_OPERATION:
                     raise HttpQueryError(
                         405,
                         f"Can only perform a {operation} operation"
@@ -287,8 +332,11 @@ def get_response(
                         headers={"Allow": "POST"},
                     )
 
-        validation_errors = validate(
-            schema, document, rules=validation_rules, max_errors=max_errors
+        validation_errors = _validate_cached(
+            schema,
+            document,
+            None if validation_rules is None else tuple(validation_rules),
+            max_errors,
         )
         if validation_errors:
             return ExecutionResult(data=None, errors=validation_errors)
@@ -321,13 +369,15 @@ def format_execution_result(
     response: Optional[Dict[str, Any]] = None
 
     if execution_result:
-        if execution_result.errors:
-            fe = [format_error(e) for e in execution_result.errors]  # type: ignore
+        errors = execution_result.errors
+        if errors:
+            if format_error is format_error_default:
+                fe: List[Dict] = list(map(_get_formatted, errors))
+            else:
+                fe = [format_error(e) for e in errors]  # type: ignore
             response = {"errors": fe}
 
-            if execution_result.errors and any(
-                not getattr(e, "path", None) for e in execution_result.errors
-            ):
+            if any(not getattr(e, "path", None) for e in errors):
                 status_code = 400
             else:
                 response["data"] = execution_result.data
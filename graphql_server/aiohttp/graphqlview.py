@@ -2,7 +2,7 @@ import asyncio
 import copy
 from collections.abc import MutableMapping
 from functools import partial
-from typing import List
+from typing import ClassVar, FrozenSet, List
 
 from aiohttp import web
 from graphql import GraphQLError, specified_rules
@@ -25,7 +25,7 @@ from graphql_server.render_graphiql import (
     GraphiQLOptions,
     render_graphiql_async,
 )
-from graphql_server.utils import wrap_in_async
+from graphql_server.utils import wrap_value_in_async
 
 
 class GraphQLView:
@@ -55,10 +55,25 @@ class GraphQLView:
     format_error = staticmethod(format_error_default)
     encode = staticmethod(json_encode)
 
+    # The accepted constructor keywords; computed in __init_subclass__
+    # for subclasses and below the class body for GraphQLView itself
+    _allowed_kwargs: ClassVar[FrozenSet[str]]
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # Subclasses may add their own attributes, so the accepted
+        # keyword set is recomputed per class
+        cls._allowed_kwargs = frozenset(
+            name for name in dir(cls) if not name.startswith("_")
+        )
+
     def __init__(self, **kwargs):
         super().__init__()
+        # A precomputed frozenset lookup replaces a full MRO scan via
+        # hasattr for every keyword argument
+        allowed = self._allowed_kwargs
         for key, value in kwargs.items():
-            if hasattr(self, key):
+            if key in allowed:
                 setattr(self, key, value)
 
         if not isinstance(self.schema, GraphQLSchema):
@@ -177,7 +192,7 @@ class GraphQLView:
                     *(
                         ex
                         if ex is not None and is_awaitable(ex)
-                        else wrap_in_async(lambda x: x)(ex)
+                        else wrap_value_in_async(ex)
                         for ex in execution_results
                     )
                 )
@@ -269,3 +284,10 @@ def _asyncify(handler):
         return await handler(request)
 
     return _dispatch
+
+
+# Initialize the accepted keyword set for the base class itself;
+# __init_subclass__ only fires for subclasses
+GraphQLView._allowed_kwargs = frozenset(
+    name for name in dir(GraphQLView) if not name.startswith("_")
+)
@@ -1,9 +1,9 @@
 import copy
 from collections.abc import MutableMapping
 from functools import partial
-from typing import List
+from typing import ClassVar, FrozenSet, List
 
-from flask import Response, render_template_string, request
+from flask import Response, render_template_string, request, stream_with_context
 from flask.views import View
 from graphql import specified_rules
 from graphql.error import GraphQLError
@@ -13,6 +13,7 @@ from graphql_server import (
     GraphQLParams,
     HttpQueryError,
     _check_jinja,
+    _encode_error_response,
     encode_execution_results,
     format_error_default,
     json_encode,
@@ -26,6 +27,17 @@ from graphql_server.render_graphiql import (
     render_graphiql_sync,
 )
 
+# The request body parsers, dispatched by mimetype with a single dict
+# lookup instead of an if/elif chain.
+# load_json_body can parse UTF-8 encoded bytes directly,
+# so the body does not need to be decoded first.
+_body_parsers = {
+    "application/graphql": lambda: {"query": request.get_data(as_text=True)},
+    "application/json": lambda: load_json_body(request.data),
+    "application/x-www-form-urlencoded": lambda: request.form,
+    "multipart/form-data": lambda: request.form,
+}
+
 
 class GraphQLView(View):
     schema = None
@@ -46,16 +58,33 @@ class GraphQLView(View):
     default_query = None
     header_editor_enabled = None
     should_persist_headers = None
+    stream_response_threshold = None
+    stream_chunk_size = 8192
 
     methods = ["GET", "POST", "PUT", "DELETE"]
 
     format_error = staticmethod(format_error_default)
     encode = staticmethod(json_encode)
 
+    # The accepted constructor keywords; computed in __init_subclass__
+    # for subclasses and below the class body for GraphQLView itself
+    _allowed_kwargs: ClassVar[FrozenSet[str]]
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # Subclasses may add their own attributes, so the accepted
+        # keyword set is recomputed per class
+        cls._allowed_kwargs = frozenset(
+            name for name in dir(cls) if not name.startswith("_")
+        )
+
     def __init__(self, **kwargs):
         super().__init__()
+        # A precomputed frozenset lookup replaces a full MRO scan via
+        # hasattr for every keyword argument
+        allowed = self._allowed_kwargs
         for key, value in kwargs.items():
-            if hasattr(self, key):
+            if key in allowed:
                 setattr(self, key, value)
 
         if not isinstance(self.schema, GraphQLSchema):
@@ -67,17 +96,32 @@ class GraphQLView(View):
         if self.jinja_env is not None:
             _check_jinja(self.jinja_env)
 
+        # Pre-bind both encoder variants so that dispatch_request does not
+        # have to allocate a new partial on every request
+        self._encode_pretty = partial(self.encode, pretty=True)
+        self._encode_plain = partial(self.encode, pretty=False)
+
+        # The type of the configured context cannot change per request,
+        # so the ABC isinstance check is done once here
+        self._context_is_dict = self.context.__class__ is dict
+        self._context_is_mapping = self.context is not None and isinstance(
+            self.context, MutableMapping
+        )
+
     def get_root_value(self):
         return self.root_value
 
     def get_context(self):
-        context = (
-            copy.copy(self.context)
-            if self.context is not None and isinstance(self.context, MutableMapping)
-            else {}
-        )
-        if isinstance(context, MutableMapping) and "request" not in context:
-            context.update({"request": request})
+        if self._context_is_dict:
+            # Plain dicts can be copied directly, without dispatching
+            # through the copy module; subclasses must keep their class
+            context = dict(self.context)
+        elif self._context_is_mapping:
+            context = copy.copy(self.context)
+        else:
+            context = {}
+        if "request" not in context:
+            context["request"] = request
         return context
 
     def get_middleware(self):
@@ -96,39 +140,55 @@ class GraphQLView(View):
             request_method = request.method.lower()
             data = self.parse_body()
 
+            # Bind the parsed query string once; every request.args access
+            # goes through the request proxy otherwise
+            qs = request.args
+
             show_graphiql = request_method == "get" and self.should_display_graphiql()
             catch = show_graphiql
 
-            pretty = self.pretty or show_graphiql or request.args.get("pretty")
+            pretty = self.pretty or show_graphiql or qs.get("pretty")
 
             all_params: List[GraphQLParams]
-            execution_results, all_params = run_http_query(
-                self.schema,
-                request_method,
-                data,
-                query_data=request.args,
-                batch_enabled=self.batch,
-                catch=catch,
-                # Execute options
-                root_value=self.get_root_value(),
-                context_value=self.get_context(),
-                middleware=self.get_middleware(),
-                validation_rules=self.get_validation_rules(),
-                execution_context_class=self.get_execution_context_class(),
-            )
-            result, status_code = encode_execution_results(
-                execution_results,
-                is_batch=isinstance(data, list),
-                format_error=self.format_error,
-                encode=partial(self.encode, pretty=pretty),
-            )
+            if (
+                show_graphiql
+                and not qs.get("query")
+                and not (isinstance(data, dict) and data.get("query"))
+            ):
+                # Neither the query string nor the body carries a query to
+                # execute, so serve the GraphiQL shell directly without
+                # going through the execution machinery.
+                result = "null"
+                all_params = [GraphQLParams(None, None, None)]
+            else:
+                execution_results, all_params = run_http_query(
+                    self.schema,
+                    request_method,
+                    data,
+                    query_data=qs,
+                    batch_enabled=self.batch,
+                    catch=catch,
+                    # Execute options
+                    root_value=self.get_root_value(),
+                    context_value=self.get_context(),
+                    middleware=self.get_middleware(),
+                    validation_rules=self.get_validation_rules(),
+                    execution_context_class=self.get_execution_context_class(),
+                )
+                result, status_code = encode_execution_results(
+                    execution_results,
+                    is_batch=isinstance(data, list),
+                    format_error=self.format_error,
+                    encode=self._encode_pretty if pretty else self._encode_plain,
+                )
 
             if show_graphiql:
+                params = all_params[0]
                 graphiql_data = GraphiQLData(
                     result=result,
-                    query=all_params[0].query,
-                    variables=all_params[0].variables,
-                    operation_name=all_params[0].operation_name,
+                    query=params.query,
+                    variables=params.variables,
+                    operation_name=params.operation_name,
                     subscription_url=self.subscriptions,
                     headers=self.headers,
                 )
@@ -148,12 +208,38 @@ class GraphQLView(View):
                 )
                 return render_template_string(source)
 
+            if (
+                self.stream_response_threshold is not None
+                and len(result) > self.stream_response_threshold
+            ):
+                # Hand large payloads to the WSGI server in fixed-size
+                # chunks instead of one big string; direct_passthrough
+                # skips the response's own encoding step, so the chunks
+                # must already be bytes
+                encoded = result.encode("utf-8")
+                chunk_size = self.stream_chunk_size
+                chunks = (
+                    encoded[i : i + chunk_size]
+                    for i in range(0, len(encoded), chunk_size)
+                )
+                return Response(
+                    stream_with_context(chunks),
+                    status=status_code,
+                    content_type="application/json",
+                    direct_passthrough=True,
+                )
+
             return Response(result, status=status_code, content_type="application/json")
 
         except HttpQueryError as e:
-            parsed_error = GraphQLError(e.message)
+            if self.format_error is format_error_default and self.encode is json_encode:
+                # The response shape is fixed, so it can be encoded directly
+                body = _encode_error_response(e.message)
+            else:
+                parsed_error = GraphQLError(e.message)
+                body = self.encode({"errors": [self.format_error(parsed_error)]})
             return Response(
-                self.encode({"errors": [self.format_error(parsed_error)]}),
+                body,
                 status=e.status_code,
                 headers=e.headers,
                 content_type="application/json",
@@ -163,20 +249,7 @@ class GraphQLView(View):
     def parse_body():
         # We use mimetype here since we don't need the other
         # information provided by content_type
-        content_type = request.mimetype
-        if content_type == "application/graphql":
-            return {"query": request.data.decode("utf8")}
-
-        elif content_type == "application/json":
-            return load_json_body(request.data.decode("utf8"))
-
-        elif content_type in (
-            "application/x-www-form-urlencoded",
-            "multipart/form-data",
-        ):
-            return request.form
-
-        return {}
+        return _body_parsers.get(request.mimetype, dict)()
 
     def should_display_graphiql(self):
         if not self.graphiql or "raw" in request.args:
@@ -192,3 +265,10 @@ class GraphQLView(View):
             and request.accept_mimetypes[best]
             > request.accept_mimetypes["application/json"]
         )
+
+
+# Initialize the accepted keyword set for the base class itself;
+# __init_subclass__ only fires for subclasses
+GraphQLView._allowed_kwargs = frozenset(
+    name for name in dir(GraphQLView) if not name.startswith("_")
+)
@@ -2,17 +2,19 @@
 (graphql-ws)[https://github.com/enisdenjo/graphql-ws]"""
 import json
 import re
-from typing import Any, Dict, Optional, Tuple
-
-# This Environment import is only for type checking purpose,
-# and only relevant if rendering GraphiQL with Jinja
-try:
-    from jinja2 import Environment
-except ImportError:  # pragma: no cover
-    pass
+from collections import namedtuple
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
+from weakref import WeakKeyDictionary
 
 from typing_extensions import TypedDict
 
+if TYPE_CHECKING:  # pragma: no cover
+    # Environment is only needed for type checking; the render functions
+    # receive an already constructed environment, so jinja2 never has to
+    # be imported at runtime here
+    from jinja2 import Environment
+
 GRAPHIQL_VERSION = "2.2.0"
 
 GRAPHIQL_TEMPLATE = """<!--
@@ -177,7 +179,7 @@ class GraphiQLConfig(TypedDict):
     graphiql_version: Optional[str]
     graphiql_template: Optional[str]
     graphiql_html_title: Optional[str]
-    jinja_env: Optional[Environment]
+    jinja_env: Optional["Environment"]
 
 
 class GraphiQLOptions(TypedDict):
@@ -202,78 +204,288 @@ class GraphiQLOptions(TypedDict):
     should_persist_headers: Optional[bool]
 
 
-def process_var(template: str, name: str, value: Any, jsonify=False) -> str:
-    pattern = r"{{\s*" + name.replace("\\", r"\\") + r"(\s*|[^}]+)*\s*}}"
-    if jsonify and value not in ["null", "undefined"]:
-        value = json.dumps(value)
+# The template variables form a fixed set, so their placeholder patterns
+# can be compiled once at import time instead of on every substitution.
+
+_REPLACE_VARS = (
+    "graphiql_version",
+    "graphiql_html_title",
+    "subscription_url",
+    "header_editor_enabled",
+    "should_persist_headers",
+)
+
+_REPLACE_JSONIFY_VARS = (
+    "query",
+    "result",
+    "variables",
+    "operation_name",
+    "default_query",
+    "headers",
+)
+
+# All variable names are plain identifiers, so they can be embedded into
+# the patterns below literally, without going through re.escape
+assert all(name.isidentifier() for name in _REPLACE_VARS + _REPLACE_JSONIFY_VARS)
+
+# The default value of every template var, shared across renders so that
+# _render_graphiql only has to write the entries that actually deviate.
+_DEFAULT_TEMPLATE_VARS: Dict[str, Any] = {
+    "graphiql_version": GRAPHIQL_VERSION,
+    "graphiql_html_title": "GraphiQL",
+    "query": None,
+    "variables": None,
+    "operation_name": None,
+    "result": None,
+    "subscription_url": "",
+    "headers": "",
+    "default_query": "",
+    "header_editor_enabled": "true",
+    "should_persist_headers": "false",
+}
+
+
+# Values that are already JavaScript literals and must not be JSON-encoded
+_JS_LITERALS = frozenset(("null", "undefined"))
+
+
+@lru_cache(maxsize=256)
+def _json_dumps_cached(value: Any) -> str:
+    return json.dumps(value)
+
+
+def _jsonify_value(value: Any) -> str:
+    """JSON-encode a template value, memoizing the frequent static ones."""
+    try:
+        return _json_dumps_cached(value)
+    except TypeError:
+        # an unhashable value, e.g. variables passed as a dict
+        return json.dumps(value)
+
+
+def _compile_var_pattern(name: str):
+    return re.compile(r"\{\{\s*" + name + r"\s*(?:\|[^}]*)?\}\}")
+
+
+_VAR_PATTERNS = {
+    name: _compile_var_pattern(name) for name in _REPLACE_VARS + _REPLACE_JSONIFY_VARS
+}
+
+
+# A single alternation over all variable names, so that a template can be
+# tokenized in one scan instead of one pass per variable. The optional
+# filter part is matched without nested quantifiers, so the pattern cannot
+# backtrack catastrophically on malformed templates.
+_VAR_ALT_PATTERN = re.compile(
+    r"\{\{\s*("
+    + "|".join(_REPLACE_VARS + _REPLACE_JSONIFY_VARS)
+    + r")\s*(?:\|[^}]*)?\}\}"
+)
+
+
+@lru_cache(maxsize=32)
+def _split_template(
+    template: str,
+) -> Tuple[Tuple[str, ...], Tuple[Tuple[int, str, bool], ...]]:
+    """Split a template once into literal parts and placeholder slots.
+
+    Returns the tuple of template parts with an empty slot for every
+    placeholder, and the slots as (index, name, jsonify) tuples. The split
+    is cached per template string, so both the default template and custom
+    templates are only tokenized on their first render.
+    """
+    parts: List[str] = []
+    slots: List[Tuple[int, str, bool]] = []
+    pos = 0
+    for match in _VAR_ALT_PATTERN.finditer(template):
+        parts.append(template[pos : match.start()])
+        name = match.group(1)
+        slots.append((len(parts), name, name in _REPLACE_JSONIFY_VARS))
+        parts.append("")
+        pos = match.end()
+    parts.append(template[pos:])
+    return tuple(parts), tuple(slots)
 
-    value = value.replace("\\", r"\\")
 
-    return re.sub(pattern, value, template)
+def process_var(template: str, name: str, value: Any, jsonify=False) -> str:
+    pattern = _VAR_PATTERNS.get(name) or _compile_var_pattern(name)
+    if jsonify and not (isinstance(value, str) and value in _JS_LITERALS):
+        value = _jsonify_value(value)
+
+    # The callback form of sub inserts the value verbatim, so backslashes
+    # do not need to be escaped and unescaped around the substitution
+    return pattern.sub(lambda _match: value, template)
 
 
 def simple_renderer(template: str, **values: Dict[str, Any]) -> str:
-    replace = [
-        "graphiql_version",
-        "graphiql_html_title",
-        "subscription_url",
-        "header_editor_enabled",
-        "should_persist_headers",
-    ]
-    replace_jsonify = [
-        "query",
-        "result",
-        "variables",
-        "operation_name",
-        "default_query",
-        "headers",
-    ]
-
-    for r in replace:
-        template = process_var(template, r, values.get(r, ""))
-
-    for r in replace_jsonify:
-        template = process_var(template, r, values.get(r, ""), True)
+    template_parts, slots = _split_template(template)
+    parts: List[Any] = list(template_parts)
+    for index, name, jsonify in slots:
+        value = values.get(name, "")
+        if jsonify and not (isinstance(value, str) and value in _JS_LITERALS):
+            value = _jsonify_value(value)
+        parts[index] = value
+    return "".join(parts)
 
-    return template
+
+# The prepared render inputs: the template string and its variables
+GraphiQLRender = namedtuple("GraphiQLRender", "template template_vars")
 
 
 def _render_graphiql(
     data: GraphiQLData,
     config: GraphiQLConfig,
     options: Optional[GraphiQLOptions] = None,
-) -> Tuple[str, Dict[str, Any]]:
+) -> GraphiQLRender:
     """When render_graphiql receives a request which does not Accept JSON, but does
     Accept HTML, it may present GraphiQL, the in-browser GraphQL explorer IDE.
     When shown, it will be pre-populated with the result of having executed
     the requested query.
     """
-    graphiql_version = config.get("graphiql_version") or GRAPHIQL_VERSION
     graphiql_template = config.get("graphiql_template") or GRAPHIQL_TEMPLATE
-    graphiql_html_title = config.get("graphiql_html_title") or "GraphiQL"
-
-    template_vars: Dict[str, Any] = {
-        "graphiql_version": graphiql_version,
-        "graphiql_html_title": graphiql_html_title,
-        "query": data.get("query"),
-        "variables": data.get("variables"),
-        "operation_name": data.get("operation_name"),
-        "result": data.get("result"),
-        "subscription_url": data.get("subscription_url") or "",
-        "headers": data.get("headers") or "",
-        "default_query": options and options.get("default_query") or "",
-        "header_editor_enabled": options
-        and options.get("header_editor_enabled")
-        or "true",
-        "should_persist_headers": options
-        and options.get("should_persist_headers")
-        or "false",
-    }
 
-    if template_vars["result"] in ("null"):
-        template_vars["result"] = None
+    result = data.get("result")
+    if result == "null":
+        result = None
+
+    # Start from the shared defaults and only write the entries that
+    # deviate from them
+    template_vars = _DEFAULT_TEMPLATE_VARS.copy()
+    if result is not None:
+        template_vars["result"] = result
+
+    for key in ("query", "variables", "operation_name"):
+        value = data.get(key)
+        if value is not None:
+            template_vars[key] = value
+    for key in ("subscription_url", "headers"):
+        value = data.get(key)
+        if value:
+            template_vars[key] = value
+
+    graphiql_version = config.get("graphiql_version")
+    if graphiql_version:
+        template_vars["graphiql_version"] = graphiql_version
+    graphiql_html_title = config.get("graphiql_html_title")
+    if graphiql_html_title:
+        template_vars["graphiql_html_title"] = graphiql_html_title
+
+    if options:
+        for key in (
+            "default_query",
+            "header_editor_enabled",
+            "should_persist_headers",
+        ):
+            value = options.get(key)
+            if value:
+                template_vars[key] = value
+
+    return GraphiQLRender(graphiql_template, template_vars)
+
+
+def _is_default_render(
+    data: GraphiQLData,
+    config: GraphiQLConfig,
+    options: Optional[GraphiQLOptions],
+) -> bool:
+    """Check whether this render would produce the stock GraphiQL page."""
+    # The views always pass an options mapping; falsy entries render the
+    # same as absent ones, so they do not disqualify the default page
+    if options and any(
+        options.get(key)
+        for key in (
+            "default_query",
+            "header_editor_enabled",
+            "should_persist_headers",
+        )
+    ):
+        return False
+    if any(
+        config.get(key)
+        for key in (
+            "graphiql_version",
+            "graphiql_template",
+            "graphiql_html_title",
+            "jinja_env",
+        )
+    ):
+        return False
+    result = data.get("result")
+    if result is not None and result != "null":
+        return False
+    return not any(
+        data.get(key)
+        for key in (
+            "query",
+            "variables",
+            "operation_name",
+            "subscription_url",
+            "headers",
+        )
+    )
+
+
+def _build_default_html() -> str:
+    template, template_vars = _render_graphiql(
+        GraphiQLData(
+            query=None,
+            variables=None,
+            operation_name=None,
+            result=None,
+            subscription_url=None,
+            headers=None,
+        ),
+        GraphiQLConfig(
+            graphiql_version=None,
+            graphiql_template=None,
+            graphiql_html_title=None,
+            jinja_env=None,
+        ),
+    )
+    return simple_renderer(template, **template_vars)
+
+
+# The fully rendered page for a plain GraphiQL load (no query, no result,
+# default config), precomputed once at import, along with its UTF-8 form.
+_DEFAULT_HTML = _build_default_html()
+_DEFAULT_HTML_BYTES = _DEFAULT_HTML.encode("utf-8")
+
+
+@lru_cache(maxsize=128)
+def _render_simple_cached(template: str, frozen_vars: Tuple[Tuple[str, Any], ...]):
+    """Memoized version of simple_renderer for hashable template vars.
+
+    Most GraphiQL page loads arrive with identical inputs (empty query and
+    result, default options), so repeat renders can return a cached string.
+    """
+    return simple_renderer(template, **dict(frozen_vars))
+
 
-    return graphiql_template, template_vars
+def _render_simple(template: str, template_vars: Dict[str, Any]) -> str:
+    try:
+        return _render_simple_cached(template, tuple(sorted(template_vars.items())))
+    except TypeError:
+        # an unhashable template var, e.g. variables passed as a dict
+        return simple_renderer(template, **template_vars)
+
+
+# The compiled templates per user-supplied Jinja environment. The
+# environments are only weakly referenced, so the cache does not keep
+# them alive longer than the application does.
+_jinja_template_cache: (
+    "WeakKeyDictionary[Environment, Dict[str, Any]]"
+) = WeakKeyDictionary()
+
+
+def _get_jinja_template(jinja_env: "Environment", template_str: str) -> Any:
+    """Compile the template string with the given environment only once."""
+    per_env = _jinja_template_cache.get(jinja_env)
+    if per_env is None:
+        per_env = _jinja_template_cache[jinja_env] = {}
+    template = per_env.get(template_str)
+    if template is None:
+        template = per_env[template_str] = jinja_env.from_string(template_str)
+    return template
 
 
 async def render_graphiql_async(
@@ -281,17 +493,20 @@ async def render_graphiql_async(
     config: GraphiQLConfig,
     options: Optional[GraphiQLOptions] = None,
 ) -> str:
+    if _is_default_render(data, config, options):
+        return _DEFAULT_HTML
+
     graphiql_template, template_vars = _render_graphiql(data, config, options)
     jinja_env = config.get("jinja_env")
 
     if jinja_env:
-        template = jinja_env.from_string(graphiql_template)
+        template = _get_jinja_template(jinja_env, graphiql_template)
         if jinja_env.is_async:
             source = await template.render_async(**template_vars)
         else:
             source = template.render(**template_vars)
     else:
-        source = simple_renderer(graphiql_template, **template_vars)
+        source = _render_simple(graphiql_template, template_vars)
     return source
 
 
@@ -300,12 +515,31 @@ def render_graphiql_sync(
     config: GraphiQLConfig,
     options: Optional[GraphiQLOptions] = None,
 ) -> str:
+    if _is_default_render(data, config, options):
+        return _DEFAULT_HTML
+
     graphiql_template, template_vars = _render_graphiql(data, config, options)
     jinja_env = config.get("jinja_env")
 
     if jinja_env:
-        template = jinja_env.from_string(graphiql_template)
+        template = _get_jinja_template(jinja_env, graphiql_template)
         source = template.render(**template_vars)
     else:
-        source = simple_renderer(graphiql_template, **template_vars)
+        source = _render_simple(graphiql_template, template_vars)
     return source
+
+
+def render_graphiql_bytes(
+    data: GraphiQLData,
+    config: GraphiQLConfig,
+    options: Optional[GraphiQLOptions] = None,
+) -> bytes:
+    """Render GraphiQL as UTF-8 encoded bytes.
+
+    Frameworks that accept a bytes response body can use this entry point
+    to skip their own encode step; the precomputed default page is
+    returned without any encoding work at all.
+    """
+    if _is_default_render(data, config, options):
+        return _DEFAULT_HTML_BYTES
+    return render_graphiql_sync(data, config, options).encode("utf-8")
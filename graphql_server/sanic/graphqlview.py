@@ -2,12 +2,11 @@ import asyncio
 import copy
 from collections.abc import MutableMapping
 from functools import partial
-from typing import List
+from typing import ClassVar, FrozenSet, List
 
 from graphql import GraphQLError, specified_rules
 from graphql.pyutils import is_awaitable
 from graphql.type.schema import GraphQLSchema
-from sanic.headers import parse_content_header
 from sanic.response import HTTPResponse, html
 from sanic.views import HTTPMethodView
 
@@ -26,8 +25,25 @@ from graphql_server.render_graphiql import (
     GraphiQLData,
     GraphiQLOptions,
     render_graphiql_async,
+    render_graphiql_bytes,
 )
-from graphql_server.utils import wrap_in_async
+from graphql_server.utils import wrap_value_in_async
+
+
+def _parse_empty_body(_request):
+    return {}
+
+
+# The request body parsers, dispatched by mime type with a single dict
+# lookup instead of an if/elif chain.
+# load_json_body can parse UTF-8 encoded bytes directly,
+# so the body does not need to be decoded first.
+_body_parsers = {
+    "application/graphql": lambda request: {"query": request.body.decode("utf8")},
+    "application/json": lambda request: load_json_body(request.body),
+    "application/x-www-form-urlencoded": lambda request: request.form,
+    "multipart/form-data": lambda request: request.form,
+}
 
 
 class GraphQLView(HTTPMethodView):
@@ -57,10 +73,25 @@ class GraphQLView(HTTPMethodView):
     format_error = staticmethod(format_error_default)
     encode = staticmethod(json_encode)
 
+    # The accepted constructor keywords; computed in __init_subclass__
+    # for subclasses and below the class body for GraphQLView itself
+    _allowed_kwargs: ClassVar[FrozenSet[str]]
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # Subclasses may add their own attributes, so the accepted
+        # keyword set is recomputed per class
+        cls._allowed_kwargs = frozenset(
+            name for name in dir(cls) if not name.startswith("_")
+        )
+
     def __init__(self, **kwargs):
         super().__init__()
+        # A precomputed frozenset lookup replaces a full MRO scan via
+        # hasattr for every keyword argument
+        allowed = self._allowed_kwargs
         for key, value in kwargs.items():
-            if hasattr(self, key):
+            if key in allowed:
                 setattr(self, key, value)
 
         if not isinstance(self.schema, GraphQLSchema):
@@ -72,26 +103,59 @@ class GraphQLView(HTTPMethodView):
         if self.jinja_env is not None:
             _check_jinja(self.jinja_env)
 
+        # Pre-bind both encoder variants so that the request handler does
+        # not have to allocate a new partial on every request
+        self._encode_pretty = partial(self.encode, pretty=True)
+        self._encode_plain = partial(self.encode, pretty=False)
+
+        if (
+            not self.graphiql
+            and type(self).should_display_graphiql
+            is GraphQLView.should_display_graphiql
+        ):
+            # GraphiQL is disabled for the lifetime of the view, so the
+            # Accept header never needs to be inspected
+            self.should_display_graphiql = lambda _request: False
+
+        # Resolve the default validation rules once instead of on every
+        # request; they cannot change after initialization
+        self._validation_rules = (
+            specified_rules if self.validation_rules is None else self.validation_rules
+        )
+
+        # The preflight response only varies in its Origin header, so
+        # the static header values are computed once
+        self._allow_methods = ", ".join(self.methods)
+        self._max_age = str(self.max_age)
+
+        # The type of the configured context cannot change per request,
+        # so the ABC isinstance check is done once here
+        self._context_is_dict = self.context.__class__ is dict
+        self._context_is_mapping = self.context is not None and isinstance(
+            self.context, MutableMapping
+        )
+
     def get_root_value(self):
         return self.root_value
 
     def get_context(self, request):
-        context = (
-            copy.copy(self.context)
-            if self.context is not None and isinstance(self.context, MutableMapping)
-            else {}
-        )
-        if isinstance(context, MutableMapping) and "request" not in context:
-            context.update({"request": request})
+        if self._context_is_dict:
+            # Plain dicts can be copied directly, without dispatching
+            # through the copy module; subclasses must keep their class
+            context = dict(self.context)
+        elif self._context_is_mapping:
+            context = copy.copy(self.context)
+        else:
+            context = {}
+        if "request" not in context:
+            context["request"] = request
         return context
 
     def get_middleware(self):
         return self.middleware
 
     def get_validation_rules(self):
-        if self.validation_rules is None:
-            return specified_rules
-        return self.validation_rules
+        return self._validation_rules
 
     def get_execution_context_class(self):
         return self.execution_context_class
@@ -106,7 +170,13 @@ class GraphQLView(HTTPMethodView):
             )
             catch = show_graphiql
 
-            pretty = self.pretty or show_graphiql or request.args.get("pretty")
+            # Only probe the query string for "pretty" when there is one;
+            # for the typical POST it is empty
+            pretty = (
+                self.pretty
+                or show_graphiql
+                or (bool(request.args) and request.args.get("pretty"))
+            )
 
             if request_method != "options":
                 all_params: List[GraphQLParams]
@@ -130,7 +200,7 @@ class GraphQLView(HTTPMethodView):
                         *(
                             ex
                             if ex is not None and is_awaitable(ex)
-                            else wrap_in_async(lambda x: x)(ex)
+                            else wrap_value_in_async(ex)
                             for ex in execution_results
                         )
                     )
@@ -141,7 +211,7 @@ class GraphQLView(HTTPMethodView):
                     exec_res,
                     is_batch=isinstance(data, list),
                     format_error=self.format_error,
-                    encode=partial(self.encode, pretty=pretty),
+                    encode=self._encode_pretty if pretty else self._encode_plain,
                 )
 
                 if show_graphiql:
@@ -164,12 +234,25 @@ class GraphQLView(HTTPMethodView):
                         header_editor_enabled=self.header_editor_enabled,
                         should_persist_headers=self.should_persist_headers,
                     )
-                    source = await render_graphiql_async(
-                        data=graphiql_data,
-                        config=graphiql_config,
-                        options=graphiql_options,
+                    if self.jinja_env is not None and self.jinja_env.is_async:
+                        source = await render_graphiql_async(
+                            data=graphiql_data,
+                            config=graphiql_config,
+                            options=graphiql_options,
+                        )
+                        return html(source)
+
+                    # The synchronous renderers can hand back the page as
+                    # ready-encoded bytes, skipping the encode step the
+                    # html helper would do per response
+                    return HTTPResponse(
+                        render_graphiql_bytes(
+                            data=graphiql_data,
+                            config=graphiql_config,
+                            options=graphiql_options,
+                        ),
+                        content_type="text/html; charset=utf-8",
                     )
-                    return html(source)
 
                 return HTTPResponse(
                     result, status=status_code, content_type="application/json"
@@ -192,29 +275,18 @@ class GraphQLView(HTTPMethodView):
     # noinspection PyBroadException
     def parse_body(self, request):
         content_type = self.get_mime_type(request)
-        if content_type == "application/graphql":
-            return {"query": request.body.decode("utf8")}
-
-        elif content_type == "application/json":
-            return load_json_body(request.body.decode("utf8"))
-
-        elif content_type in (
-            "application/x-www-form-urlencoded",
-            "multipart/form-data",
-        ):
-            return request.form
-
-        return {}
+        return _body_parsers.get(content_type, _parse_empty_body)(request)
 
     @staticmethod
     def get_mime_type(request):
         # We use mime type here since we don't need the other
-        # information provided by content_type
-        if "content-type" not in request.headers:
+        # information provided by content_type, so the header only has
+        # to be split before the first ";" instead of fully parsed
+        content_type = request.headers.get("content-type")
+        if content_type is None:
             return None
 
-        mime_type, _ = parse_content_header(request.headers["content-type"])
-        return mime_type
+        return content_type.split(";", 1)[0].strip().lower()
 
     def should_display_graphiql(self, request):
         if not self.graphiql or "raw" in request.args:
@@ -224,8 +296,21 @@ class GraphQLView(HTTPMethodView):
 
     @staticmethod
     def request_wants_html(request):
-        accept = request.headers.get("accept", {})
-        return "text/html" in accept or "*/*" in accept
+        accept = request.headers.get("accept")
+        if not accept:
+            return False
+
+        # The overwhelmingly common case is that the first Accept token
+        # already decides, so only fall back to scanning all tokens when
+        # it does not match
+        first = accept.split(",", 1)[0].split(";", 1)[0].strip()
+        if first in ("text/html", "*/*"):
+            return True
+
+        return any(
+            token.split(";", 1)[0].strip() in ("text/html", "*/*")
+            for token in accept.split(",")
+        )
 
     def process_preflight(self, request):
         """Preflight request support for apollo-client
@@ -238,9 +323,16 @@ class GraphQLView(HTTPMethodView):
                 status=200,
                 headers={
                     "Access-Control-Allow-Origin": origin,
-                    "Access-Control-Allow-Methods": ", ".join(self.methods),
-                    "Access-Control-Max-Age": str(self.max_age),
+                    "Access-Control-Allow-Methods": self._allow_methods,
+                    "Access-Control-Max-Age": self._max_age,
                 },
             )
         else:
             return HTTPResponse(status=400)
+
+
+# Initialize the accepted keyword set for the base class itself;
+# __init_subclass__ only fires for subclasses
+GraphQLView._allowed_kwargs = frozenset(
+    name for name in dir(GraphQLView) if not name.startswith("_")
+)
@@ -7,7 +7,7 @@ else:  # pragma: no cover
     from typing_extensions import ParamSpec
 
 
-__all__ = ["wrap_in_async"]
+__all__ = ["wrap_in_async", "wrap_value_in_async"]
 
 P = ParamSpec("P")
 R = TypeVar("R")
@@ -23,3 +23,15 @@ def wrap_in_async(f: Callable[P, R]) -> Callable[P, Awaitable[R]]:
         return f(*args, **kwargs)
 
     return f_async
+
+
+async def wrap_value_in_async(value: R) -> R:
+    """Wrap an already computed value in a coroutine resolving to it.
+
+    This is the fast path for ``wrap_in_async(lambda x: x)(value)``:
+    it creates a single coroutine instead of building a new coroutine
+    function plus an identity call for every value. A coroutine is also
+    the cheapest awaitable to hand to asyncio.gather, which wraps any
+    other kind of awaitable in an extra coroutine of its own.
+    """
+    return value
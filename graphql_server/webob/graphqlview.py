@@ -1,17 +1,19 @@
 import copy
 from collections.abc import MutableMapping
-from functools import partial
-from typing import List
+from functools import lru_cache, partial
+from typing import ClassVar, FrozenSet, List
 
 from graphql import specified_rules
 from graphql.error import GraphQLError
 from graphql.type.schema import GraphQLSchema
 from webob import Response
+from webob.acceptparse import create_accept_header
 
 from graphql_server import (
     GraphQLParams,
     HttpQueryError,
     _check_jinja,
+    _encode_error_response,
     encode_execution_results,
     format_error_default,
     json_encode,
@@ -26,6 +28,33 @@ from graphql_server.render_graphiql import (
 )
 
 
+def _parse_empty_body(_request):
+    return {}
+
+
+@lru_cache(maxsize=64)
+def _accept_prefers_html(accept_header):
+    """Run the content negotiation once per distinct Accept header.
+
+    Clients send the same Accept header on every request, so the parsed
+    negotiation result can be shared across requests.
+    """
+    accept = create_accept_header(accept_header)
+    return accept.best_match(["application/json", "text/html"]) == "text/html"
+
+
+# The request body parsers, dispatched by content type with a single dict
+# lookup instead of an if/elif chain.
+# load_json_body can parse UTF-8 encoded bytes directly,
+# so the body does not need to be decoded first.
+_body_parsers = {
+    "application/graphql": lambda request: {"query": request.body.decode("utf8")},
+    "application/json": lambda request: load_json_body(request.body),
+    "application/x-www-form-urlencoded": lambda request: request.params,
+    "multipart/form-data": lambda request: request.params,
+}
+
+
 class GraphQLView:
     schema = None
     root_value = None
@@ -51,10 +80,25 @@ class GraphQLView:
     format_error = staticmethod(format_error_default)
     encode = staticmethod(json_encode)
 
+    # The accepted constructor keywords; computed in __init_subclass__
+    # for subclasses and below the class body for GraphQLView itself
+    _allowed_kwargs: ClassVar[FrozenSet[str]]
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # Subclasses may add their own attributes, so the accepted
+        # keyword set is recomputed per class
+        cls._allowed_kwargs = frozenset(
+            name for name in dir(cls) if not name.startswith("_")
+        )
+
     def __init__(self, **kwargs):
         super().__init__()
+        # A precomputed frozenset lookup replaces a full MRO scan via
+        # hasattr for every keyword argument
+        allowed = self._allowed_kwargs
         for key, value in kwargs.items():
-            if hasattr(self, key):
+            if key in allowed:
                 setattr(self, key, value)
 
         if not isinstance(self.schema, GraphQLSchema):
@@ -66,26 +110,54 @@ class GraphQLView:
         if self.jinja_env is not None:
             _check_jinja(self.jinja_env)
 
+        # Pre-bind both encoder variants so that dispatch_request does not
+        # have to allocate a new partial on every request
+        self._encode_pretty = partial(self.encode, pretty=True)
+        self._encode_plain = partial(self.encode, pretty=False)
+
+        if (
+            not self.graphiql
+            and type(self).should_display_graphiql
+            is GraphQLView.should_display_graphiql
+        ):
+            # GraphiQL is disabled for the lifetime of the view, so the
+            # Accept header never needs to be inspected
+            self.should_display_graphiql = lambda _request: False
+
+        # Resolve the default validation rules once instead of on every
+        # request; they cannot change after initialization
+        self._validation_rules = (
+            specified_rules if self.validation_rules is None else self.validation_rules
+        )
+
+        # The type of the configured context cannot change per request,
+        # so the ABC isinstance check is done once here
+        self._context_is_dict = self.context.__class__ is dict
+        self._context_is_mapping = self.context is not None and isinstance(
+            self.context, MutableMapping
+        )
+
     def get_root_value(self):
         return self.root_value
 
     def get_context(self, request):
-        context = (
-            copy.copy(self.context)
-            if self.context is not None and isinstance(self.context, MutableMapping)
-            else {}
-        )
-        if isinstance(context, MutableMapping) and "request" not in context:
-            context.update({"request": request})
+        if self._context_is_dict:
+            # Plain dicts can be copied directly, without dispatching
+            # through the copy module; subclasses must keep their class
+            context = dict(self.context)
+        elif self._context_is_mapping:
+            context = copy.copy(self.context)
+        else:
+            context = {}
+        if "request" not in context:
+            context["request"] = request
         return context
 
     def get_middleware(self):
         return self.middleware
 
     def get_validation_rules(self):
-        if self.validation_rules is None:
-            return specified_rules
-        return self.validation_rules
+        return self._validation_rules
 
     def get_execution_context_class(self):
         return self.execution_context_class
@@ -95,19 +167,29 @@ class GraphQLView:
             request_method = request.method.lower()
             data = self.parse_body(request)
 
+            # Bind the combined params once; every request.params access
+            # re-reads the property otherwise
+            query_data = request.params
+
             show_graphiql = request_method == "get" and self.should_display_graphiql(
                 request
             )
             catch = show_graphiql
 
-            pretty = self.pretty or show_graphiql or request.params.get("pretty")
+            # Only probe the request params for "pretty" when there are
+            # any; for the typical POST the query string is empty
+            pretty = (
+                self.pretty
+                or show_graphiql
+                or (bool(query_data) and query_data.get("pretty"))
+            )
 
             all_params: List[GraphQLParams]
             execution_results, all_params = run_http_query(
                 self.schema,
                 request_method,
                 data,
-                query_data=request.params,
+                query_data=query_data,
                 batch_enabled=self.batch,
                 catch=catch,
                 # Execute options
@@ -122,7 +204,7 @@ class GraphQLView:
                 execution_results,
                 is_batch=isinstance(data, list),
                 format_error=self.format_error,
-                encode=partial(self.encode, pretty=pretty),
+                encode=self._encode_pretty if pretty else self._encode_plain,
             )
 
             if show_graphiql:
@@ -163,9 +245,14 @@ class GraphQLView:
             )
 
         except HttpQueryError as e:
-            parsed_error = GraphQLError(e.message)
+            if self.format_error is format_error_default and self.encode is json_encode:
+                # The response shape is fixed, so it can be encoded directly
+                body = _encode_error_response(e.message)
+            else:
+                parsed_error = GraphQLError(e.message)
+                body = self.encode({"errors": [self.format_error(parsed_error)]})
             return Response(
-                self.encode({"errors": [self.format_error(parsed_error)]}),
+                body,
                 status=e.status_code,
                 charset=self.charset,
                 headers=e.headers or {},
@@ -177,28 +264,34 @@ class GraphQLView:
     def parse_body(request):
         # We use mimetype here since we don't need the other
         # information provided by content_type
-        content_type = request.content_type
-        if content_type == "application/graphql":
-            return {"query": request.body.decode("utf8")}
-
-        elif content_type == "application/json":
-            return load_json_body(request.body.decode("utf8"))
-
-        elif content_type in (
-            "application/x-www-form-urlencoded",
-            "multipart/form-data",
-        ):
-            return request.params
-
-        return {}
+        return _body_parsers.get(request.content_type, _parse_empty_body)(request)
 
     def should_display_graphiql(self, request):
-        if not self.graphiql or "raw" in request.params:
+        if not self.graphiql:
+            return False
+
+        # request.GET only parses the query string, unlike
+        # request.params which also materializes the request body
+        if "raw" in request.GET:
             return False
 
         return self.request_wants_html(request)
 
     @staticmethod
     def request_wants_html(request):
-        best = request.accept.best_match(["application/json", "text/html"])
-        return best == "text/html"
+        # Short-circuit the common cases before running the full
+        # content negotiation
+        accept_header = request.environ.get("HTTP_ACCEPT")
+        if not accept_header:
+            return False
+        if accept_header == "text/html":
+            return True
+
+        return _accept_prefers_html(accept_header)
+
+
+# Initialize the accepted keyword set for the base class itself;
+# __init_subclass__ only fires for subclasses
+GraphQLView._allowed_kwargs = frozenset(
+    name for name in dir(GraphQLView) if not name.startswith("_")
+)
@@ -1,5 +1,6 @@
 import json
 from urllib.parse import urlencode
+from wsgiref.validate import validator
 
 import pytest
 from flask import url_for
@@ -341,6 +342,21 @@ def test_not_pretty_by_default(app, client):
     assert response.data.decode() == '{"data":{"test":"Hello World"}}'
 
 
+@pytest.mark.parametrize(
+    "app", [create_app(stream_response_threshold=0, stream_chunk_size=8)]
+)
+def test_streams_responses_above_threshold(app, client):
+    # wsgiref.validate rejects non-bytes chunks that the test client
+    # alone would silently re-encode
+    app.wsgi_app = validator(app.wsgi_app)
+    response = client.get(url_string(app, query="{test}"))
+
+    assert response.status_code == 200
+    assert response_json(response) == {"data": {"test": "Hello World"}}
+    # the validator also asserts that the iterator gets closed
+    response.close()
+
+
 def test_supports_pretty_printing_by_request(app, client):
     response = client.get(url_string(app, query="{test}", pretty="1"))
 
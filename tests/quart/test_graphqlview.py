@@ -448,6 +448,20 @@ async def test_not_pretty_by_default(app: Quart, client: TestClientProtocol):
     assert result == '{"data":{"test":"Hello World"}}'
 
 
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "app", [create_app(stream_response_threshold=0, stream_chunk_size=8)]
+)
+async def test_streams_responses_above_threshold(
+    app: Quart, client: TestClientProtocol
+):
+    response = await execute_client(app, client, query="{test}")
+
+    assert response.status_code == 200
+    result = await response.get_data(as_text=True)
+    assert response_json(result) == {"data": {"test": "Hello World"}}
+
+
 @pytest.mark.asyncio
 async def test_supports_pretty_printing_by_request(
     app: Quart, client: TestClientProtocol